@@ -0,0 +1,37 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled price-curve interpolation, used by gas_storage_pricing when Numba is unavailable."""
+from libc.stdint cimport int64_t
+
+
+cdef inline Py_ssize_t _bisect_right(const int64_t[::1] xs, int64_t x) noexcept nogil:
+    cdef Py_ssize_t lo = 0
+    cdef Py_ssize_t hi = xs.shape[0]
+    cdef Py_ssize_t mid
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if x < xs[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+cdef inline double _interp(const int64_t[::1] xs, const double[::1] ys, int64_t x) noexcept nogil:
+    cdef Py_ssize_t idx
+    cdef int64_t t0, span
+    cdef double weight
+    
+    # Mirrors _interp_kernel in gas_storage_pricing.py
+    idx = min(max(_bisect_right(xs, x) - 1, 0), xs.shape[0] - 2)
+    t0 = xs[idx]
+    span = xs[idx + 1] - t0
+    weight = min(max(<double>(x - t0 + (span == 0)) / <double>max(span, 1), 0.0), 1.0)
+    return ys[idx] + weight * (ys[idx + 1] - ys[idx])
+
+
+def interp_scalar(const int64_t[::1] xs, const double[::1] ys, int64_t x):
+    """Linearly interpolate ys at int64 date x over the sorted int64 dates xs."""
+    cdef double result
+    with nogil:
+        result = _interp(xs, ys, x)
+    return result
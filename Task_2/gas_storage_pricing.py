@@ -1,8 +1,106 @@
+import functools
+from collections import OrderedDict, namedtuple
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Tuple, Union
-import matplotlib.pyplot as plt
+
+try:
+    from numba import njit
+    interp_scalar = None
+except ImportError:  # Numba is optional; the kernels below then run as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+    
+    try:
+        # Compiled scalar interpolation, built with `cythonize -i _interp.pyx`. It is found only when
+        # Task_2 is on sys.path (e.g. running this script directly); otherwise NumPy is used silently
+        from _interp import interp_scalar
+    except ImportError:
+        interp_scalar = None
+
+NSEC_PER_DAY = 86_400 * 10**9
+
+# One executed step of a storage strategy; use Action._asdict() for the mapping form
+Action = namedtuple('Action', 'date operation volume price cash_flow inventory_after')
+
+
+@njit(cache=True, fastmath=True)
+def _interp_kernel(x, idx, xs, ys):
+    """Linearly interpolate ys at x, given the index of the last point of the sorted xs <= x.
+    
+    Shared by the scalar float64 / int64-nanosecond path and the float32 / int32-day batch path;
+    Numba compiles one specialization per dtype combination.
+    """
+    # Clamping the index and the weight covers x outside the curve without branching
+    idx = min(max(idx, 0), xs.shape[0] - 2)
+    t0 = xs[idx]
+    span = xs[idx + 1] - t0
+    # A zero-width interval (duplicate dates) resolves to its right end once x reaches it
+    weight = min(max((x - t0 + (span == 0)) / max(span, 1), 0.0), 1.0)
+    return ys[idx] + weight * (ys[idx + 1] - ys[idx])
+
+
+@njit(cache=True, fastmath=True)
+def _interp_batch_f4_kernel(days, curve_days, curve_prices):
+    """Interpolate int32 day dates on an int32-day / float32-price curve, flat beyond its ends."""
+    out = np.empty(days.shape[0], dtype=np.float32)
+    for i in range(days.shape[0]):
+        idx = np.searchsorted(curve_days, days[i], side='right') - 1
+        out[i] = _interp_kernel(days[i], idx, curve_days, curve_prices)
+    return out
+
+
+@njit(cache=True)
+def _storage_dp_kernel(levels, prices, can_inject, can_withdraw, hold_days, cost_rate, rate, end_price):
+    """Return the index into levels of the inventory held after each event on the best path."""
+    n_events = prices.shape[0]
+    n_levels = levels.shape[0]
+    tol = 1e-9 * max(rate, 1.0)
+    
+    # value[j]: best cash so far ending at levels[j]; storage starts empty (levels[0] == 0)
+    value = np.full(n_levels, -np.inf)
+    value[0] = 0.0
+    choice = np.zeros((n_events, n_levels), dtype=np.int64)
+    
+    # levels is sorted, so the levels reachable in one move of at most rate form a window [lo[j], hi[j])
+    lo = np.searchsorted(levels, levels - rate - tol)
+    hi = np.searchsorted(levels, levels + rate + tol, side='right')
+    
+    for i in range(n_events):
+        new_value = np.full(n_levels, -np.inf)
+        for j in range(n_levels):
+            # Holding the current level is preferred on ties
+            best = value[j]
+            best_k = j
+            for k in range(lo[j], hi[j]):
+                if k == j or value[k] == -np.inf:
+                    continue
+                delta = levels[j] - levels[k]
+                if (delta > 0 and not can_inject[i]) or (delta < 0 and not can_withdraw[i]):
+                    continue
+                v = value[k] - delta * prices[i]
+                if v > best:
+                    best = v
+                    best_k = k
+            new_value[j] = best - levels[j] * cost_rate * hold_days[i]
+            choice[i, j] = best_k
+        value = new_value
+    
+    # Whatever is left in storage is liquidated at the contract end price
+    best_j = 0
+    for j in range(n_levels):
+        if value[j] + levels[j] * end_price > value[best_j] + levels[best_j] * end_price:
+            best_j = j
+    
+    path = np.zeros(n_events, dtype=np.int64)
+    for i in range(n_events - 1, -1, -1):
+        path[i] = best_j
+        best_j = choice[i, best_j]
+    return path
+
 
 class GasStoragePricer:
     """
@@ -16,19 +114,64 @@ class GasStoragePricer:
     - Market price volatility
     """
     
-    def __init__(self, price_data: pd.DataFrame, storage_cost_per_unit_per_day: float = 0.01):
+    # Number of prepared contracts kept in the strategy cache (least recently used are evicted)
+    STRATEGY_CACHE_SIZE = 128
+    
+    # Upper bound on max_storage_volume / injection_withdrawal_rate, which sets the size of the DP grid
+    MAX_RATE_STEPS = 10_000
+    
+    def __init__(self, price_data: pd.DataFrame, storage_cost_per_unit_per_day: float = 0.01,
+                 quantize: bool = False):
         """
         Initialize the pricing model with historical price data.
         
         Args:
             price_data: DataFrame with 'Dates' and 'Prices' columns
             storage_cost_per_unit_per_day: Daily storage cost per unit of gas
+            quantize: Batch-interpolate on float32 prices and int32 whole-day dates
+                instead of float64 prices and int64 nanosecond dates (results are still float64)
         """
-        self.price_data = price_data.copy()
-        self.price_data['Dates'] = pd.to_datetime(self.price_data['Dates'])
-        self.price_data = self.price_data.sort_values('Dates')
         self.storage_cost_per_unit_per_day = storage_cost_per_unit_per_day
+        self.quantize = quantize
+        self.set_price_data(price_data)
+    
+    def set_price_data(self, price_data: pd.DataFrame):
+        """
+        Load (or replace) the price curve used for interpolation.
         
+        Args:
+            price_data: DataFrame with 'Dates' and 'Prices' columns
+        """
+        # Keep only the sorted price curve as plain arrays for fast lookups
+        dates_i8 = pd.to_datetime(price_data['Dates']).to_numpy(dtype='datetime64[ns]').view('i8')
+        order = np.argsort(dates_i8, kind='stable')
+        self._dates_i8 = dates_i8[order]
+        self._prices = price_data['Prices'].to_numpy(dtype=np.float64)[order]
+        
+        # Half-width copy of the curve for quantized batch interpolation
+        if self.quantize:
+            self._days_i4 = (self._dates_i8 // NSEC_PER_DAY).astype(np.int32)
+            self._prices_f4 = self._prices.astype(np.float32)
+        
+        # Detect one price point per consecutive month so the interval can be found by month arithmetic
+        months = self._dates_i8.view('datetime64[ns]').astype('datetime64[M]')
+        self._regular = bool(len(months) > 1 and np.all(np.diff(months) == np.timedelta64(1, 'M')))
+        self._month0 = int(months[0].view('i8'))
+        
+        # Memoize interpolation per curve; replacing the curve starts a fresh cache
+        self._interp_cached = functools.lru_cache(maxsize=1024)(self._interpolate_i8)
+        self._strategy_cache = OrderedDict()
+    
+    def __getstate__(self):
+        # The memoized interpolator wraps a bound method and cannot be pickled; it is rebuilt on load
+        state = self.__dict__.copy()
+        del state['_interp_cached']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._interp_cached = functools.lru_cache(maxsize=1024)(self._interpolate_i8)
+    
     def interpolate_price(self, date: datetime) -> float:
         """
         Interpolate price for a given date using linear interpolation.
@@ -39,24 +182,41 @@ class GasStoragePricer:
         Returns:
             Interpolated price for the given date
         """
-        if date <= self.price_data['Dates'].min():
-            return self.price_data.iloc[0]['Prices']
-        if date >= self.price_data['Dates'].max():
-            return self.price_data.iloc[-1]['Prices']
-        
-        # Find surrounding dates
-        before = self.price_data[self.price_data['Dates'] <= date].iloc[-1]
-        after = self.price_data[self.price_data['Dates'] > date].iloc[0]
-        
-        # Linear interpolation
-        days_total = (after['Dates'] - before['Dates']).days
-        days_from_before = (date - before['Dates']).days
-        
-        if days_total == 0:
-            return before['Prices']
+        d = int(np.datetime64(date).astype('datetime64[ns]').view('i8'))
+        return self._interp_cached(d)
+    
+    def _interpolate_i8(self, d: int) -> float:
+        """Interpolate price for a date given as int64 nanoseconds since the epoch (memoized per date)."""
+        if interp_scalar is not None:
+            return interp_scalar(self._dates_i8, self._prices, d)
+        
+        if self._regular:
+            # Monthly grid: the interval index follows directly from the calendar month
+            idx = int(np.datetime64(d, 'ns').astype('datetime64[M]').view('i8')) - self._month0
+            idx = min(max(idx, 0), len(self._dates_i8) - 1)
+            idx -= int(d < self._dates_i8[idx])
+        else:
+            # Find surrounding dates with a binary search on the sorted curve
+            idx = np.searchsorted(self._dates_i8, d, side='right') - 1
+        
+        return _interp_kernel(d, idx, self._dates_i8, self._prices)
+    
+    def _batch_interpolate(self, dates: Union[List[datetime], np.ndarray]) -> np.ndarray:
+        """
+        Interpolate prices for many dates in a single vectorized call.
         
-        weight = days_from_before / days_total
-        return before['Prices'] * (1 - weight) + after['Prices'] * weight
+        Args:
+            dates: Target dates for price interpolation
+            
+        Returns:
+            Array of interpolated prices, flat beyond the ends of the curve
+        """
+        d = np.array(dates, dtype='datetime64[ns]').view('i8')
+        if self.quantize:
+            # float32 stays inside the kernel; callers (price_map, the DP, reported actions) get float64
+            prices = _interp_batch_f4_kernel((d // NSEC_PER_DAY).astype(np.int32), self._days_i4, self._prices_f4)
+            return prices.astype(np.float64)
+        return np.interp(d, self._dates_i8, self._prices)
     
     def calculate_storage_costs(self, inventory_schedule: List[Tuple[datetime, float]]) -> float:
         """
@@ -68,17 +228,17 @@ class GasStoragePricer:
         Returns:
             Total storage costs
         """
-        total_cost = 0.0
+        dates_i8 = np.array([date for date, _ in inventory_schedule], dtype='datetime64[ns]').view('i8')
+        inventories = np.fromiter((level for _, level in inventory_schedule), dtype=np.float64,
+                                  count=len(inventory_schedule))
         
-        for i in range(len(inventory_schedule) - 1):
-            current_date, current_inventory = inventory_schedule[i]
-            next_date, _ = inventory_schedule[i + 1]
-            
-            days = (next_date - current_date).days
-            daily_cost = current_inventory * self.storage_cost_per_unit_per_day
-            total_cost += daily_cost * days
-            
-        return total_cost
+        return self._storage_costs(dates_i8, inventories)
+    
+    def _storage_costs(self, dates_i8: np.ndarray, inventories: np.ndarray) -> float:
+        """Storage costs for parallel arrays of int64 schedule dates and inventory levels."""
+        days = np.diff(dates_i8) // NSEC_PER_DAY
+        return float(self.storage_cost_per_unit_per_day
+                     * np.dot(inventories[:-1], days.astype(np.float64)))
     
     def optimize_storage_strategy(self, 
                                 injection_dates: List[datetime],
@@ -90,8 +250,9 @@ class GasStoragePricer:
         """
         Optimize the storage strategy to maximize contract value.
         
-        This is a simplified optimization that considers all possible injection/withdrawal
-        combinations and selects the most profitable strategy.
+        Solves a dynamic program over the date-ordered injection/withdrawal events and the
+        inventory levels the optimal schedule can occupy, trading off price spreads against
+        storage costs.
         
         Args:
             injection_dates: List of possible injection dates
@@ -105,98 +266,119 @@ class GasStoragePricer:
             Dictionary with optimal strategy details
         """
         
+        key = (tuple(injection_dates), tuple(withdrawal_dates), injection_withdrawal_rate,
+               max_storage_volume, contract_start, contract_end)
+        # The event stream and its prices do not depend on the storage cost, so build them once per contract
+        plan = self._strategy_cache.get(key)
+        if plan is None:
+            plan = self._strategy_cache[key] = self._build_strategy(*key)
+            if len(self._strategy_cache) > self.STRATEGY_CACHE_SIZE:
+                self._strategy_cache.popitem(last=False)
+        else:
+            self._strategy_cache.move_to_end(key)
+        
+        return self._evaluate_strategy(plan)
+    
+    def _build_strategy(self,
+                        injection_dates: Tuple[datetime, ...],
+                        withdrawal_dates: Tuple[datetime, ...],
+                        injection_withdrawal_rate: float,
+                        max_storage_volume: float,
+                        contract_start: datetime,
+                        contract_end: datetime) -> Dict:
+        """Prepare the storage-cost independent inputs of the optimization for one contract."""
+        
+        # Merge injection and withdrawal opportunities into one date-ordered event stream (a single sort)
+        inj_i8 = np.array(injection_dates, dtype='datetime64[ns]').view('i8')
+        wdr_i8 = np.array(withdrawal_dates, dtype='datetime64[ns]').view('i8')
+        event_i8 = np.unique(np.concatenate((inj_i8, wdr_i8)))
+        events = event_i8.view('datetime64[ns]').astype('datetime64[us]').tolist()
+        bounds_i8 = np.array([contract_start, contract_end], dtype='datetime64[ns]').view('i8')
+        
         # Get prices for all relevant dates
-        all_dates = sorted(set(injection_dates + withdrawal_dates + [contract_start, contract_end]))
-        price_map = {date: self.interpolate_price(date) for date in all_dates}
+        prices = self._batch_interpolate(np.concatenate((event_i8, bounds_i8)).view('datetime64[ns]'))
+        price_map = dict(zip(events + [contract_start, contract_end], prices.tolist()))
+        prices = prices[:len(events)]
+        
+        # Optimal inventories lie on multiples of the rate counted up from empty or down from full
+        if injection_withdrawal_rate > 0 and max_storage_volume > 0:
+            if max_storage_volume / injection_withdrawal_rate > self.MAX_RATE_STEPS:
+                raise ValueError(
+                    f"max_storage_volume / injection_withdrawal_rate exceeds {self.MAX_RATE_STEPS}; "
+                    f"the inventory grid would be too large to optimize over"
+                )
+            steps = np.arange(int(max_storage_volume // injection_withdrawal_rate) + 1) * injection_withdrawal_rate
+            levels = np.unique(np.round(np.concatenate((steps, max_storage_volume - steps)), 9))
+        else:
+            levels = np.zeros(1)
         
-        # Simple greedy strategy: inject when prices are low, withdraw when high
-        injection_prices = [(date, price_map[date]) for date in injection_dates]
-        withdrawal_prices = [(date, price_map[date]) for date in withdrawal_dates]
+        return {
+            'events': events,
+            'prices': prices,
+            'can_inject': np.isin(event_i8, inj_i8),
+            'can_withdraw': np.isin(event_i8, wdr_i8),
+            'hold_days': (np.diff(np.append(event_i8, bounds_i8[1])) // NSEC_PER_DAY).astype(np.float64),
+            'levels': levels,
+            'rate': float(injection_withdrawal_rate),
+            'contract_start': contract_start,
+            'contract_end': contract_end,
+            'end_price': float(price_map[contract_end]),
+            'price_map': price_map
+        }
+    
+    def _evaluate_strategy(self, plan: Dict) -> Dict:
+        """Solve a prepared contract at the current storage cost and value the resulting schedule."""
+        events, prices, levels = plan['events'], plan['prices'], plan['levels']
+        contract_start, contract_end = plan['contract_start'], plan['contract_end']
+        end_price = plan['end_price']
         
-        # Sort by price (ascending for injection, descending for withdrawal)
-        injection_prices.sort(key=lambda x: x[1])
-        withdrawal_prices.sort(key=lambda x: x[1], reverse=True)
+        # Dynamic program over (event, inventory level) for the value-maximizing schedule
+        path = _storage_dp_kernel(levels, prices, plan['can_inject'], plan['can_withdraw'], plan['hold_days'],
+                                  float(self.storage_cost_per_unit_per_day),
+                                  plan['rate'], end_price)
         
-        # Build optimal strategy
+        # Execute strategy and track inventory
         strategy = []
-        current_inventory = 0.0
         total_cash_flow = 0.0
-        
-        # Combine and sort all operations by date
-        all_operations = []
-        
-        # Add profitable injection opportunities
-        for inj_date, inj_price in injection_prices:
-            # Check if there are withdrawal opportunities at higher prices
-            profitable_withdrawals = [w for w in withdrawal_prices if w[1] > inj_price and w[0] > inj_date]
-            if profitable_withdrawals and current_inventory < max_storage_volume:
-                volume_to_inject = min(injection_withdrawal_rate, max_storage_volume - current_inventory)
-                if volume_to_inject > 0:
-                    all_operations.append((inj_date, 'inject', volume_to_inject, inj_price))
-        
-        # Add profitable withdrawal opportunities
-        for with_date, with_price in withdrawal_prices:
-            # Check if we have inventory from previous injections
-            prior_injections = [op for op in all_operations if op[0] < with_date and op[1] == 'inject']
-            if prior_injections:
-                # Find the lowest cost injection that hasn't been withdrawn yet
-                available_volume = sum(op[2] for op in prior_injections)
-                if available_volume > 0:
-                    volume_to_withdraw = min(injection_withdrawal_rate, available_volume)
-                    all_operations.append((with_date, 'withdraw', volume_to_withdraw, with_price))
-        
-        # Sort operations by date
-        all_operations.sort(key=lambda x: x[0])
-        
-        # Execute strategy and track inventory
-        inventory_schedule = [(contract_start, 0.0)]
+        schedule_dates = [contract_start]
+        schedule_levels = [0.0]
         current_inventory = 0.0
         
-        for date, operation, volume, price in all_operations:
-            if operation == 'inject':
-                if current_inventory + volume <= max_storage_volume:
-                    current_inventory += volume
-                    total_cash_flow -= volume * price  # Cash outflow for purchase
-                    strategy.append({
-                        'date': date,
-                        'operation': 'inject',
-                        'volume': volume,
-                        'price': price,
-                        'cash_flow': -volume * price,
-                        'inventory_after': current_inventory
-                    })
-            elif operation == 'withdraw':
-                if current_inventory >= volume:
-                    current_inventory -= volume
-                    total_cash_flow += volume * price  # Cash inflow from sale
-                    strategy.append({
-                        'date': date,
-                        'operation': 'withdraw',
-                        'volume': volume,
-                        'price': price,
-                        'cash_flow': volume * price,
-                        'inventory_after': current_inventory
-                    })
+        for date, price, j in zip(events, prices.tolist(), path.tolist()):
+            volume = float(levels[j]) - current_inventory
+            if volume != 0:
+                current_inventory = float(levels[j])
+                total_cash_flow -= volume * price  # Outflow for purchase, inflow from sale
+                strategy.append(Action(
+                    date=date,
+                    operation='inject' if volume > 0 else 'withdraw',
+                    volume=abs(volume),
+                    price=price,
+                    cash_flow=-volume * price,
+                    inventory_after=current_inventory
+                ))
             
-            inventory_schedule.append((date, current_inventory))
+            schedule_dates.append(date)
+            schedule_levels.append(current_inventory)
         
         # Add final inventory liquidation at contract end if needed
         if current_inventory > 0:
-            end_price = self.interpolate_price(contract_end)
             total_cash_flow += current_inventory * end_price
-            strategy.append({
-                'date': contract_end,
-                'operation': 'liquidate',
-                'volume': current_inventory,
-                'price': end_price,
-                'cash_flow': current_inventory * end_price,
-                'inventory_after': 0.0
-            })
-        
-        inventory_schedule.append((contract_end, 0.0))
-        
-        # Calculate storage costs
-        storage_costs = self.calculate_storage_costs(inventory_schedule)
+            strategy.append(Action(
+                date=contract_end,
+                operation='liquidate',
+                volume=current_inventory,
+                price=end_price,
+                cash_flow=current_inventory * end_price,
+                inventory_after=0.0
+            ))
+        
+        schedule_dates.append(contract_end)
+        schedule_levels.append(0.0)
+        inventory_schedule = list(zip(schedule_dates, schedule_levels))
+        
+        # Calculate storage costs: the inventory after each event is held for that event's precomputed days
+        storage_costs = float(self.storage_cost_per_unit_per_day * np.dot(levels[path], plan['hold_days']))
         
         # Calculate final contract value
         contract_value = total_cash_flow - storage_costs
@@ -207,7 +389,7 @@ class GasStoragePricer:
             'total_cash_flow': total_cash_flow,
             'storage_costs': storage_costs,
             'contract_value': contract_value,
-            'price_map': price_map
+            'price_map': dict(plan['price_map'])  # A copy, so callers cannot alter the cached plan
         }
     
     def price_contract(self,
@@ -234,16 +416,15 @@ class GasStoragePricer:
             Dictionary with contract valuation and strategy details
         """
         
-        # Convert string dates to datetime objects
-        if isinstance(contract_start, str):
-            contract_start = datetime.strptime(contract_start, '%Y-%m-%d')
-        if isinstance(contract_end, str):
-            contract_end = datetime.strptime(contract_end, '%Y-%m-%d')
-        
-        injection_dates = [datetime.strptime(d, '%Y-%m-%d') if isinstance(d, str) else d 
-                          for d in injection_dates]
-        withdrawal_dates = [datetime.strptime(d, '%Y-%m-%d') if isinstance(d, str) else d 
-                           for d in withdrawal_dates]
+        # Convert string dates to datetime objects in one vectorized parse
+        n_inj = len(injection_dates)
+        parsed = pd.to_datetime(
+            [contract_start, contract_end] + list(injection_dates) + list(withdrawal_dates),
+            format='%Y-%m-%d', cache=True
+        ).to_pydatetime().tolist()
+        contract_start, contract_end = parsed[0], parsed[1]
+        injection_dates = parsed[2:2 + n_inj]
+        withdrawal_dates = parsed[2 + n_inj:]
         
         # Override storage cost if provided
         if storage_cost_per_unit_per_day is not None:
@@ -261,6 +442,24 @@ class GasStoragePricer:
         
         return result
     
+    def price_contract_sweep(self,
+                             storage_costs: List[float],
+                             **contract_params) -> List[Dict]:
+        """
+        Price the same contract under several storage cost rates.
+        
+        The contract is prepared once and only re-solved per rate.
+        
+        Args:
+            storage_costs: Storage cost rates to evaluate
+            **contract_params: Remaining arguments of price_contract
+            
+        Returns:
+            List of price_contract results, in the order of storage_costs
+        """
+        return [self.price_contract(storage_cost_per_unit_per_day=cost, **contract_params)
+                for cost in storage_costs]
+    
     def print_valuation_summary(self, result: Dict):
         """Print a formatted summary of the contract valuation."""
         print("=" * 60)
@@ -274,9 +473,9 @@ class GasStoragePricer:
         print("-" * 40)
         
         for i, action in enumerate(result['strategy']):
-            print(f"{i+1}. {action['date'].strftime('%Y-%m-%d')}: "
-                  f"{action['operation'].upper()} {action['volume']:.1f} units "
-                  f"at ${action['price']:.2f} -> Cash flow: ${action['cash_flow']:,.2f}")
+            print(f"{i+1}. {action.date.strftime('%Y-%m-%d')}: "
+                  f"{action.operation.upper()} {action.volume:.1f} units "
+                  f"at ${action.price:.2f} -> Cash flow: ${action.cash_flow:,.2f}")
         
         print()
         print(f"Total Operations: {len(result['strategy'])}")
@@ -306,7 +505,7 @@ def load_nat_gas_data():
     }
     
     df = pd.DataFrame(data)
-    df['Dates'] = pd.to_datetime(df['Dates'])
+    df['Dates'] = pd.to_datetime(df['Dates'], format='%m/%d/%y', cache=True)
     return df
 
 # Test the pricing model
@@ -317,59 +516,58 @@ if __name__ == "__main__":
     # Initialize the pricer
     pricer = GasStoragePricer(price_data, storage_cost_per_unit_per_day=0.01)
     
-    # Test Case 1: Simple seasonal strategy
-    print("TEST CASE 1: Seasonal Storage Strategy")
-    print("=" * 50)
-    
-    result1 = pricer.price_contract(
-        injection_dates=['2021-05-31', '2021-06-30', '2021-07-31'],  # Summer (lower prices)
-        withdrawal_dates=['2021-12-31', '2022-01-31', '2022-02-28'],  # Winter (higher prices)
-        injection_withdrawal_rate=50.0,  # 50 units per day max
-        max_storage_volume=100.0,  # 100 units max capacity
-        contract_start='2021-05-01',
-        contract_end='2022-03-31',
+    # Warm-up on a tiny contract so Numba compiles (or loads cached) the storage DP kernel,
+    # the only kernel price_contract uses, before the reported runs
+    pricer.price_contract(
+        injection_dates=['2021-06-30'],
+        withdrawal_dates=['2021-12-31'],
+        injection_withdrawal_rate=1.0,
+        max_storage_volume=1.0,
+        contract_start='2021-06-01',
+        contract_end='2022-01-31',
         storage_cost_per_unit_per_day=0.01
     )
     
-    pricer.print_valuation_summary(result1)
-    
-    print("\n" + "=" * 80 + "\n")
-    
-    # Test Case 2: Multiple injection/withdrawal opportunities
-    print("TEST CASE 2: Multiple Opportunities Strategy")
-    print("=" * 50)
-    
-    result2 = pricer.price_contract(
-        injection_dates=['2022-04-30', '2022-05-31', '2022-06-30', '2022-07-31'],
-        withdrawal_dates=['2022-11-30', '2022-12-31', '2023-01-31', '2023-02-28'],
-        injection_withdrawal_rate=25.0,
-        max_storage_volume=75.0,
-        contract_start='2022-04-01',
-        contract_end='2023-03-31',
-        storage_cost_per_unit_per_day=0.015
-    )
-    
-    pricer.print_valuation_summary(result2)
-    
-    print("\n" + "=" * 80 + "\n")
-    
-    # Test Case 3: High storage capacity, low injection rate
-    print("TEST CASE 3: High Capacity, Low Rate Strategy")
-    print("=" * 50)
-    
-    result3 = pricer.price_contract(
-        injection_dates=['2023-06-30', '2023-07-31', '2023-08-31'],
-        withdrawal_dates=['2023-12-31', '2024-01-31'],
-        injection_withdrawal_rate=20.0,
-        max_storage_volume=200.0,
-        contract_start='2023-06-01',
-        contract_end='2024-02-29',
-        storage_cost_per_unit_per_day=0.008
-    )
-    
-    pricer.print_valuation_summary(result3)
+    test_cases = [
+        # Test Case 1: Simple seasonal strategy
+        ("Seasonal Storage Strategy", {
+            'injection_dates': ['2021-05-31', '2021-06-30', '2021-07-31'],  # Summer (lower prices)
+            'withdrawal_dates': ['2021-12-31', '2022-01-31', '2022-02-28'],  # Winter (higher prices)
+            'injection_withdrawal_rate': 50.0,  # 50 units per day max
+            'max_storage_volume': 100.0,  # 100 units max capacity
+            'contract_start': '2021-05-01',
+            'contract_end': '2022-03-31',
+            'storage_cost_per_unit_per_day': 0.01
+        }),
+        # Test Case 2: Multiple injection/withdrawal opportunities
+        ("Multiple Opportunities Strategy", {
+            'injection_dates': ['2022-04-30', '2022-05-31', '2022-06-30', '2022-07-31'],
+            'withdrawal_dates': ['2022-11-30', '2022-12-31', '2023-01-31', '2023-02-28'],
+            'injection_withdrawal_rate': 25.0,
+            'max_storage_volume': 75.0,
+            'contract_start': '2022-04-01',
+            'contract_end': '2023-03-31',
+            'storage_cost_per_unit_per_day': 0.015
+        }),
+        # Test Case 3: High storage capacity, low injection rate
+        ("High Capacity, Low Rate Strategy", {
+            'injection_dates': ['2023-06-30', '2023-07-31', '2023-08-31'],
+            'withdrawal_dates': ['2023-12-31', '2024-01-31'],
+            'injection_withdrawal_rate': 20.0,
+            'max_storage_volume': 200.0,
+            'contract_start': '2023-06-01',
+            'contract_end': '2024-02-29',
+            'storage_cost_per_unit_per_day': 0.008
+        }),
+    ]
     
-    print("\n" + "=" * 80 + "\n")
+    for case_number, (title, params) in enumerate(test_cases, start=1):
+        print(f"TEST CASE {case_number}: {title}")
+        print("=" * 50)
+        
+        pricer.print_valuation_summary(pricer.price_contract(**params))
+        
+        print("\n" + "=" * 80 + "\n")
     
     # Price sensitivity analysis
     print("PRICE SENSITIVITY ANALYSIS")
@@ -389,6 +587,6 @@ if __name__ == "__main__":
     print(f"{'Storage Cost':<15} {'Contract Value':<15} {'Storage Costs':<15} {'Net Cash Flow':<15}")
     print("-" * 65)
     
-    for cost in storage_costs:
-        result = pricer.price_contract(storage_cost_per_unit_per_day=cost, **base_params)
+    results = pricer.price_contract_sweep(storage_costs, **base_params)
+    for cost, result in zip(storage_costs, results):
         print(f"{cost:<15.3f} ${result['contract_value']:<14.2f} ${result['storage_costs']:<14.2f} ${result['total_cash_flow']:<14.2f}")